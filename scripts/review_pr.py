@@ -1,182 +1,549 @@
 import os
 import subprocess
 import argparse
-import json
-from openai import OpenAI
-from github import Github
+import asyncio
+import codecs
+import functools
+import hashlib
+import re
+from concurrent.futures import ThreadPoolExecutor
+import orjson
+import requests
+from requests.adapters import HTTPAdapter
+from openai import AsyncOpenAI
+from github import GithubRetry
+
+MAX_WORKERS = 10
+GITHUB_API_URL = os.getenv("GITHUB_API_URL", "https://api.github.com")
+GITHUB_TOKEN = os.getenv("GITHUB_TOKEN")
+GITHUB_REPOSITORY = os.getenv("GITHUB_REPOSITORY")
+CACHE_DIR = os.path.expanduser(os.getenv("GENOPS_CACHE_DIR", "~/.cache/genops"))
+MODEL = "gpt-4.1-mini"
+BATCH_SIZE = 60 * 1024  # characters of context per model call
+MAX_BATCHES = 8  # context beyond this many batches is dropped
+CONFIG_SUFFIXES = ('.yml', '.yaml', '.json')
+MAX_FILE_SIZE = 64 * 1024  # larger files are reduced to head + tail
+SKIP_DIRS = {'.git', 'node_modules', '.venv', 'venv', 'dist', 'build', '__pycache__'}
+
+# Prompt templates are filled with str.replace so the large context is copied only once
+PROMPT_TEMPLATE = """
+You are GenOps Guardian — an AI DevOps assistant.
+Analyze the following repository or PR data and output a JSON object with:
+- "risk_score": integer (0-100, where 100 is most risky)
+- "risk_level": Low / Medium / High
+- "issues": list of detected problems
+- "analysis_text": a short human-readable explanation
+
+Base your score on:
+1. Potential pipeline failures (weight 30%)
+2. Security issues (weight 40%)
+3. Optimization/code quality suggestions (weight 20%)
+4. Size/complexity of changes (weight 10%)
+
+---
+__CONTEXT__
+"""
+
+# Structured output: the API guarantees the response parses into this shape
+RISK_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "risk_score": {"type": "integer"},
+        "risk_level": {"type": "string", "enum": ["Low", "Medium", "High"]},
+        "issues": {"type": "array", "items": {"type": "string"}},
+        "analysis_text": {"type": "string"},
+    },
+    "required": ["risk_score", "risk_level", "issues", "analysis_text"],
+    "additionalProperties": False,
+}
+
+MERGE_PROMPT_TEMPLATE = """
+You are GenOps Guardian — an AI DevOps assistant.
+The repository or PR data was analyzed in parts. Merge the partial analyses below
+into a single JSON object with the same keys:
+- "risk_score": integer (0-100) for the change as a whole
+- "risk_level": Low / Medium / High
+- "issues": combined list of detected problems, without duplicates
+- "analysis_text": a short human-readable explanation
+
+---
+__PARTIALS__
+"""
+
+
+def _elide(head, tail, digest):
+    """Joins the head and tail bytes of a large file around a truncation marker."""
+    return (
+        head.decode("utf-8", errors="ignore")
+        + f"\n...[truncated, sha256={digest}]...\n"
+        + tail.decode("utf-8", errors="ignore")
+    )
+
+
+def _decode_capped(data):
+    """Decodes file bytes, reducing data over MAX_FILE_SIZE to head + tail."""
+    if len(data) > MAX_FILE_SIZE:
+        half = MAX_FILE_SIZE // 2
+        return _elide(data[:half], data[-half:], hashlib.sha256(data).hexdigest())
+    return data.decode("utf-8", errors="ignore")
+
+
+def _read_file(path):
+    """Reads a text file, returning None if it cannot be read.
+
+    Files over MAX_FILE_SIZE are streamed: only their head and tail are kept,
+    along with a SHA-256 fingerprint of the whole file.
+    """
+    try:
+        if os.path.getsize(path) <= MAX_FILE_SIZE:
+            with open(path, "r", encoding="utf-8", errors="ignore") as f:
+                return f.read()
+
+        half = MAX_FILE_SIZE // 2
+        digest = hashlib.sha256()
+        with open(path, "rb") as f:
+            head = f.read(half)
+            digest.update(head)
+            for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                digest.update(chunk)
+            f.seek(-half, os.SEEK_END)
+            tail = f.read()
+        return _elide(head, tail, digest.hexdigest())
+    except Exception:
+        return None
+
+
+def _cache_path(namespace, *key_parts):
+    key = hashlib.sha256(":".join(key_parts).encode()).hexdigest()
+    return os.path.join(CACHE_DIR, namespace, f"{key}.json")
+
+
+def _cache_get(path):
+    """Returns the cached value stored at path, or None on a miss.
+
+    A hit refreshes the file's mtime, so pruning by age only drops unused entries.
+    """
+    try:
+        with open(path, "rb") as f:
+            value = orjson.loads(f.read())["value"]
+        os.utime(path)
+        return value
+    except Exception:
+        return None
+
+
+def _cache_put(path, value):
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "wb") as f:
+            f.write(orjson.dumps({"value": value}))
+    except Exception as e:
+        print(f"[Warning] Could not write cache {path}: {e}")
+
+
+def _disk_cached(namespace):
+    """Caches a context collector's result on disk, keyed on the repo and its arguments.
+
+    The collector returns (context_parts, complete). Incomplete results are not
+    stored so failures are retried; callers only receive context_parts.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(repo_path, *args, **kwargs):
+            repo_name = GITHUB_REPOSITORY or os.path.abspath(repo_path)
+            options = [f"{k}={v}" for k, v in sorted(kwargs.items())]
+            cache_path = _cache_path(namespace, repo_name, *args, *options)
+
+            result = _cache_get(cache_path)
+            if result is None:
+                result, complete = func(repo_path, *args, **kwargs)
+                if complete:
+                    _cache_put(cache_path, result)
+            return result
+        return wrapper
+    return decorator
+
+
+def _github_retry():
+    return GithubRetry(total=5, backoff_factor=0.5)
+
+
+def _github_session(token):
+    """Returns a requests session authenticated against the GitHub REST API.
+
+    Requests to the API root are retried with PyGithub's rate-limit-aware policy.
+    """
+    session = requests.Session()
+    session.mount(GITHUB_API_URL, HTTPAdapter(max_retries=_github_retry()))
+    session.headers.update({
+        "Authorization": f"Bearer {token}",
+        "Accept": "application/vnd.github+json",
+    })
+    return session
+
+
+def _read_local_configs(repo_path):
+    """Reads YAML/JSON configs from the local checkout as (path, content) pairs."""
+    config_paths = []
+    for root, dirs, files in os.walk(repo_path):
+        # Prune directories that never hold configs but can hold huge numbers of files
+        dirs[:] = [d for d in dirs if d not in SKIP_DIRS]
+        for file in files:
+            if file.endswith(CONFIG_SUFFIXES):
+                config_paths.append(os.path.join(root, file))
+
+    # Read them on a worker pool; this is pure I/O wait
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        contents = list(executor.map(_read_file, config_paths))
+
+    return [
+        (os.path.relpath(path, repo_path), content)
+        for path, content in zip(config_paths, contents)
+        if content is not None
+    ]
 
 
 def collect_repo_context(repo_path):
-    """Collects logs, configs, and recent git changes from the repository."""
+    """Collects logs, configs, and recent git changes from the repository as a list of context sections."""
     context_parts = []
 
     # Collect CI/CD configs and YAMLs
-    for root, _, files in os.walk(repo_path):
-        for file in files:
-            if file.endswith(('.yml', '.yaml', '.json')):
-                try:
-                    with open(os.path.join(root, file), 'r', encoding='utf-8', errors='ignore') as f:
-                        content = f.read()
-                    context_parts.append(f"### File: {file}\n{content}")
-                except Exception:
-                    pass
-
-    # Last 20 commits
+    for path, content in _read_local_configs(repo_path):
+        context_parts.append(f"### File: {path}\n{content}")
+
+    # Last 20 commits and diff of last 5 commits, run as concurrent git processes
+    git_commands = [
+        ("git log", "Recent Commits", ["git", "-C", repo_path, "log", "-n", "20", "--pretty=oneline"]),
+        ("git diff", "Recent Changes (diff)", ["git", "-C", repo_path, "diff", "HEAD~5", "HEAD"]),
+    ]
+    procs = []
+    for name, title, cmd in git_commands:
+        try:
+            proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, text=True)
+        except Exception as e:
+            proc = e
+        procs.append((name, title, cmd, proc))
+
+    for name, title, cmd, proc in procs:
+        try:
+            if isinstance(proc, Exception):
+                raise proc
+            output, _ = proc.communicate()
+            if proc.returncode != 0:
+                raise subprocess.CalledProcessError(proc.returncode, cmd)
+            context_parts.append(f"### {title}\n{output}")
+        except Exception as e:
+            context_parts.append(f"[Error collecting {name}: {e}]")
+
+    return context_parts
+
+
+def _read_git_file(repo_path, rev, path):
+    """Reads a file as of rev from git, returning None if it cannot be read.
+
+    Unlike reading the working tree this works in sparse and partial clones,
+    where git fetches the blob on demand. As with _read_file, blobs over
+    MAX_FILE_SIZE are streamed so only their head and tail are kept in memory.
+    """
     try:
-        git_log = subprocess.check_output(
-            ["git", "-C", repo_path, "log", "-n", "20", "--pretty=oneline"],
-            text=True
+        proc = subprocess.Popen(
+            ["git", "-C", repo_path, "cat-file", "blob", f"{rev}:{path}"],
+            stdout=subprocess.PIPE, stderr=subprocess.DEVNULL
         )
-        context_parts.append(f"### Recent Commits\n{git_log}")
-    except Exception as e:
-        context_parts.append(f"[Error collecting git log: {e}]")
+        with proc:
+            data = proc.stdout.read(MAX_FILE_SIZE + 1)
+            if len(data) <= MAX_FILE_SIZE:
+                content = data.decode("utf-8", errors="ignore")
+            else:
+                half = MAX_FILE_SIZE // 2
+                digest = hashlib.sha256(data)
+                head, tail = data[:half], data[-half:]
+                for chunk in iter(lambda: proc.stdout.read(1024 * 1024), b""):
+                    digest.update(chunk)
+                    tail = (tail + chunk)[-half:]
+                content = _elide(head, tail, digest.hexdigest())
+        if proc.returncode != 0:
+            return None
+        return content
+    except Exception:
+        return None
 
-    # Diff of last 5 commits
-    try:
-        git_diff = subprocess.check_output(
-            ["git", "-C", repo_path, "diff", "HEAD~5", "HEAD"],
-            text=True
-        )
-        context_parts.append(f"### Recent Changes (diff)\n{git_diff}")
-    except Exception as e:
-        context_parts.append(f"[Error collecting git diff: {e}]")
 
-    return "\n\n".join(context_parts)
+def _unquote_git_path(path):
+    """Undoes the C-style quoting git applies to paths with special characters."""
+    if not path.startswith('"'):
+        return path
+    return codecs.escape_decode(path[1:-1].encode("utf-8"))[0].decode("utf-8", errors="replace")
+
 
+def _diff_header_path(header, changed_files):
+    """Returns which of changed_files a `diff --git a/... b/...` header line belongs to.
 
-def collect_pr_context(repo_path, base_sha, head_sha):
-    """Collects only changed files and diffs from the PR."""
+    A path may itself contain " b/", so every candidate split is checked against the
+    known file names rather than trusting a single regex match.
+    """
+    for marker in (' "b/', " b/"):
+        start = header.find(marker)
+        while start != -1:
+            path = _unquote_git_path(header[start + 1:])[2:]
+            if path in changed_files:
+                return path
+            start = header.find(marker, start + 1)
+    return None
+
+
+@_disk_cached("pr-sections")
+def collect_pr_context(repo_path, base_sha, head_sha, include_file_bodies=False):
+    """Collects only changed files and diffs from the PR as a list of context sections.
+
+    Full file contents are added only when include_file_bodies is set; the diff
+    hunks are usually enough for review and cost far fewer tokens.
+    """
     context_parts = []
+    complete = True
 
     try:
-        # Get list of changed files in PR
+        # Get list of changed files in PR; -z gives raw, unquoted paths
         changed_files = subprocess.check_output(
-            ["git", "-C", repo_path, "diff", "--name-only", base_sha, head_sha],
-            text=True
-        ).strip().split("\n")
+            ["git", "-C", repo_path, "diff", "--name-only", "-z", base_sha, head_sha],
+            encoding="utf-8", errors="replace"
+        ).split("\0")
+        changed_files = [f for f in changed_files if f.strip()]
 
         context_parts.append(f"### Changed Files\n" + "\n".join(changed_files))
 
+        # One git process for the whole PR diff, split into per-file patches; decoding is
+        # lossy so a single non-UTF-8 file cannot fail the whole PR context
+        full_diff = subprocess.check_output(
+            ["git", "-C", repo_path, "-c", "core.quotePath=false",
+             "diff", "--no-color", "--no-ext-diff", "--src-prefix=a/", "--dst-prefix=b/",
+             "--unified=3", base_sha, head_sha],
+            encoding="utf-8", errors="replace"
+        )
+        file_diffs = {}
+        known_files = set(changed_files)
+        for patch in re.split(r"(?m)^(?=diff --git )", full_diff):
+            if patch.startswith("diff --git "):
+                file_path = _diff_header_path(patch.split("\n", 1)[0], known_files)
+                if file_path is not None:
+                    # Cap huge patches (e.g. regenerated lockfiles) like large file bodies
+                    file_diffs[file_path] = _decode_capped(patch.encode("utf-8"))
+
+        file_bodies = {}
+        if include_file_bodies:
+            # Contents at the PR head; files deleted by the PR have none
+            head_files = [f for f in changed_files if "\ndeleted file mode " not in file_diffs.get(f, "")]
+
+            # Read changed file contents concurrently
+            with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+                file_bodies = dict(zip(head_files, executor.map(
+                    lambda f: _read_git_file(repo_path, head_sha, f), head_files
+                )))
+
         # Add file contents + diff for each changed file
         for file_path in changed_files:
-            if not file_path.strip():
-                continue
-
-            file_abs_path = os.path.join(repo_path, file_path)
-
-            # Read file content (if exists)
-            if os.path.exists(file_abs_path):
-                try:
-                    with open(file_abs_path, "r", encoding="utf-8", errors="ignore") as f:
-                        content = f.read()
+            # File content (if exists)
+            if file_path in file_bodies:
+                content = file_bodies[file_path]
+                if content is not None:
                     context_parts.append(f"### File: {file_path}\n{content}")
-                except Exception:
+                else:
                     context_parts.append(f"[Error reading file: {file_path}]")
+                    complete = False
 
-            # Get file diff
-            try:
-                file_diff = subprocess.check_output(
-                    ["git", "-C", repo_path, "diff", base_sha, head_sha, "--", file_path],
-                    text=True
-                )
+            file_diff = file_diffs.get(file_path)
+            if file_diff is not None:
                 context_parts.append(f"### Diff for {file_path}\n{file_diff}")
-            except Exception:
+            else:
                 context_parts.append(f"[Error getting diff for: {file_path}]")
+                complete = False
 
         # PR commit messages
         git_log = subprocess.check_output(
             ["git", "-C", repo_path, "log", f"{base_sha}..{head_sha}", "--pretty=oneline"],
-            text=True
+            encoding="utf-8", errors="replace"
         )
         context_parts.append(f"### PR Commits\n{git_log}")
 
     except Exception as e:
         context_parts.append(f"[Error collecting PR context: {e}]")
+        complete = False
 
-    return "\n\n".join(context_parts)
+    return context_parts, complete
 
 
 def post_pr_comment(pr_number, message):
     """Posts AI analysis as a comment on the PR."""
-    token = os.getenv("GITHUB_TOKEN")
-    repo_name = os.getenv("GITHUB_REPOSITORY")
-
-    if not token or not repo_name:
+    if not GITHUB_TOKEN or not GITHUB_REPOSITORY:
         print("[Warning] Missing GITHUB_TOKEN or GITHUB_REPOSITORY, skipping PR comment.")
         return
 
     try:
-        gh = Github(token)
-        repo = gh.get_repo(repo_name)
-        pr = repo.get_pull(int(pr_number))
-        pr.create_issue_comment(message)
+        # PR comments live on the issues endpoint; posting directly skips fetching the PR
+        response = _github_session(GITHUB_TOKEN).post(
+            f"{GITHUB_API_URL}/repos/{GITHUB_REPOSITORY}/issues/{int(pr_number)}/comments",
+            json={"body": message},
+            timeout=30
+        )
+        response.raise_for_status()
         print(f"✅ Comment posted to PR #{pr_number}")
     except Exception as e:
         print(f"[Error posting PR comment: {e}]")
 
 
-def run_analysis(mode, repo_path):
+def _batch_context(sections, batch_size=BATCH_SIZE, max_batches=MAX_BATCHES):
+    """Packs context sections into at most max_batches batches of batch_size characters.
+
+    Sections are grouped by the directory of the file they describe so related
+    files land in the same batch. A section that fits in a batch is kept whole;
+    larger ones are cut into pieces, starting in the room left in the current batch.
+    Anything beyond max_batches is dropped and replaced by a truncation marker.
+    """
+    def _section_dir(section):
+        match = re.match(r"### (?:File: |Diff for )(.+)", section)
+        return os.path.dirname(match.group(1)) if match else ""
+
+    batches = []
+    current, room = [], batch_size
+    for section in sorted(sections, key=_section_dir):
+        if current and room < len(section) <= batch_size:
+            batches.append("\n\n".join(current))
+            current, room = [], batch_size
+        while len(section) > room:
+            current.append(section[:room])
+            section = section[room:]
+            batches.append("\n\n".join(current))
+            current, room = [], batch_size
+        current.append(section)
+        room = max(room - len(section) - 2, 0)
+    if current:
+        batches.append("\n\n".join(current))
+
+    if len(batches) > max_batches:
+        omitted = batches[max_batches:]
+        batches = batches[:max_batches]
+        marker = (
+            f"[Context truncated: {len(omitted)} more batches "
+            f"({sum(len(b) for b in omitted)} characters) omitted]"
+        )
+        batches[-1] += f"\n\n{marker}"
+        print(f"[Warning] {marker}")
+    return batches
+
+
+def _build_prompt(context):
+    """Prompt for structured JSON risk analysis."""
+    return PROMPT_TEMPLATE.replace("__CONTEXT__", context)
+
+
+def _build_merge_prompt(partials):
+    """Prompt that merges per-batch analyses into one result."""
+    joined = "\n\n".join(f"### Partial analysis {i}\n{p}" for i, p in enumerate(partials, 1))
+    return MERGE_PROMPT_TEMPLATE.replace("__PARTIALS__", joined)
+
+
+async def _call_llm(client, prompt, sink=None):
+    """Sends the prompt to the model, reusing a cached answer for an identical prompt.
+
+    The response is streamed; if a sink file is given, text is written to it as it arrives.
+    Only responses that complete normally are cached; failed, incomplete or refused
+    responses raise instead.
+    """
+    schema = orjson.dumps(RISK_SCHEMA, option=orjson.OPT_SORT_KEYS).decode()
+    cache_path = _cache_path("llm", MODEL, schema, prompt)
+    output = _cache_get(cache_path)
+    if output is None:
+        stream = await client.responses.create(
+            model=MODEL,
+            input=prompt,
+            temperature=0,
+            text={"format": {"type": "json_schema", "name": "risk", "schema": RISK_SCHEMA, "strict": True}},
+            stream=True
+        )
+        chunks, refusal = [], []
+        completed = False
+        async for event in stream:
+            if event.type == "response.output_text.delta":
+                chunks.append(event.delta)
+                if sink is not None:
+                    sink.write(event.delta)
+                    sink.flush()
+            elif event.type == "response.refusal.delta":
+                refusal.append(event.delta)
+            elif event.type == "response.completed":
+                completed = True
+            elif event.type == "response.incomplete":
+                reason = getattr(event.response.incomplete_details, "reason", "unknown")
+                raise RuntimeError(f"Model response incomplete: {reason}")
+            elif event.type == "response.failed":
+                error = getattr(event.response.error, "message", "unknown error")
+                raise RuntimeError(f"Model response failed: {error}")
+            elif event.type == "error":
+                raise RuntimeError(f"Model stream error: {event.message}")
+
+        if refusal:
+            raise RuntimeError(f"Model refused the request: {''.join(refusal)}")
+        if not completed:
+            raise RuntimeError("Model stream ended before the response completed")
+
+        output = "".join(chunks)
+        _cache_put(cache_path, output)
+    elif sink is not None:
+        sink.write(output)
+    return output
+
+
+async def _analyze(api_key, sections, sink=None):
+    """Runs the model over the context, fanning out one concurrent request per batch.
+
+    Only the call producing the final answer streams into the sink.
+    """
+    async with AsyncOpenAI(api_key=api_key) as client:
+        batches = _batch_context(sections)
+        if len(batches) == 1:
+            return await _call_llm(client, _build_prompt("\n\n".join(sections)), sink)
+
+        # Analyze each batch separately, then merge the partial results
+        semaphore = asyncio.Semaphore(MAX_WORKERS)
+
+        async def _ask(batch):
+            async with semaphore:
+                return await _call_llm(client, _build_prompt(batch))
+
+        partials = await asyncio.gather(*[_ask(b) for b in batches])
+        return await _call_llm(client, _build_merge_prompt(partials), sink)
+
+
+def run_analysis(mode, repo_path, include_file_bodies=False):
     """Runs AI-powered analysis and calculates risk score."""
     api_key = os.getenv("GENOPS_API_KEY")
     if not api_key:
         raise ValueError("GENOPS_API_KEY environment variable is missing!")
 
-    client = OpenAI(api_key=api_key)
-
     # Select context
     if mode == "demo":
-        context = "This is a simulated CI/CD pipeline log with no real data."
+        sections = ["This is a simulated CI/CD pipeline log with no real data."]
     elif mode == "real":
-        context = collect_repo_context(repo_path)
+        sections = collect_repo_context(repo_path)
     elif mode == "pr":
         base_sha = os.getenv("BASE_SHA")
         head_sha = os.getenv("HEAD_SHA")
         if not base_sha or not head_sha:
             raise ValueError("BASE_SHA and HEAD_SHA environment variables are required for PR mode.")
-        context = collect_pr_context(repo_path, base_sha, head_sha)
+        sections = collect_pr_context(repo_path, base_sha, head_sha, include_file_bodies=include_file_bodies)
     else:
         raise ValueError("Mode must be 'real', 'demo', or 'pr'.")
 
-    # Prompt for structured JSON risk analysis
-    prompt = f"""
-    You are GenOps Guardian — an AI DevOps assistant.
-    Analyze the following repository or PR data and output a JSON object with:
-    - "risk_score": integer (0-100, where 100 is most risky)
-    - "risk_level": Low / Medium / High
-    - "issues": list of detected problems
-    - "analysis_text": a short human-readable explanation
-
-    Base your score on:
-    1. Potential pipeline failures (weight 30%)
-    2. Security issues (weight 40%)
-    3. Optimization/code quality suggestions (weight 20%)
-    4. Size/complexity of changes (weight 10%)
-
-    ---
-    {context}
-    """
-
-    response = client.responses.create(
-        model="gpt-4.1-mini",
-        input=prompt,
-        temperature=0
-    )
+    # Stream the raw model response to disk as it is generated
+    os.makedirs("analysis_results", exist_ok=True)
+    with open("analysis_results/response.txt", "w", encoding="utf-8") as sink:
+        ai_output = asyncio.run(_analyze(api_key, sections, sink))
 
-    try:
-        ai_output = response.output_text.strip()
-        data = json.loads(ai_output)  # Ensure valid JSON
-    except Exception:
-        data = {
-            "risk_score": 50,
-            "risk_level": "Medium",
-            "issues": ["AI returned unstructured output"],
-            "analysis_text": response.output_text
-        }
+    data = orjson.loads(ai_output)
 
     # Save risk JSON
-    os.makedirs("analysis_results", exist_ok=True)
-    with open("analysis_results/risk.json", "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2)
+    with open("analysis_results/risk.json", "wb") as f:
+        f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
 
     # Build final summary
     summary = (
@@ -192,10 +559,12 @@ if __name__ == "__main__":
     parser = argparse.ArgumentParser()
     parser.add_argument("--mode", required=True, help="Mode: real, demo, or pr")
     parser.add_argument("--repo", required=False, default=".", help="Path to repo")
+    parser.add_argument("--include-file-bodies", action="store_true",
+                        help="PR mode: include full contents of changed files, not just their diffs")
     args = parser.parse_args()
 
     print("🔍 Running GenOps Guardian...")
-    result = run_analysis(args.mode, args.repo)
+    result = run_analysis(args.mode, args.repo, args.include_file_bodies)
 
     print("\n📊 Analysis Result:\n")
     print(result)